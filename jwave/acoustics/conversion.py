@@ -18,6 +18,11 @@ from jax import numpy as jnp
 
 from jwave.geometry import Sensors
 
+# Constants of the decibel to neper conversion, evaluated once at import
+# time: 100 / (20 * log10(e)) and 1e-6 / (2*pi).
+_DB2NEPER_SCALE = 100 / (20 * np.log10(np.exp(1)))
+_DB2NEPER_BASE = 1e-6 / (2 * np.pi)
+
 
 def pressure_from_density(sensors_data: jnp.ndarray, sound_speed: jnp.ndarray,
                           sensors: Sensors) -> jnp.ndarray:
@@ -55,4 +60,4 @@ def db2neper(
     Returns:
         jnp.ndarray: Absorption coefficient in nepers.
     """
-    return 100 * alpha * ((1e-6 / (2 * np.pi))**y) / (20 * np.log10(np.exp(1)))
+    return _DB2NEPER_SCALE * alpha * (_DB2NEPER_BASE**y)
@@ -15,15 +15,18 @@
 
 import math
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from typing import List, Tuple, Union
 from numpy.typing import ArrayLike
 
 import numpy as np
+from jax import jit, lax, vmap
 from jax import numpy as jnp
+from jax.errors import TracerArrayConversionError
 from jax.tree_util import register_pytree_node_class
 from jaxdf import Field, FourierSeries, OnGrid
 from jaxdf.geometry import Domain
-from jaxdf.operators import dot_product, functional
+from jaxdf.operators import dot_product
 from plum import parametric, type_of
 
 Number = Union[float, int]
@@ -117,7 +120,7 @@ def points_on_circle(
         centre: Tuple[float, float],
         cast_int: bool = True,
         angle: float = 0.0,
-        max_angle: float = 2 * np.pi) -> Tuple[List[float], List[float]]:
+        max_angle: float = 2 * np.pi) -> Tuple[np.ndarray, np.ndarray]:
     """
     Generate points on a circle.
 
@@ -130,14 +133,14 @@ def points_on_circle(
         max_angle (float, optional): Maximum angle to reach in radians. Default is 2*pi (full circle).
 
     Returns:
-        x, y (tuple): Lists of x and y coordinates of the points.
+        x, y (tuple): Arrays of x and y coordinates of the points.
     """
     angles = np.linspace(0, max_angle, n, endpoint=False)
-    x = (radius * np.cos(angles + angle) + centre[0]).tolist()
-    y = (radius * np.sin(angles + angle) + centre[1]).tolist()
+    x = radius * np.cos(angles + angle) + centre[0]
+    y = radius * np.sin(angles + angle) + centre[1]
     if cast_int:
-        x = list(map(int, x))
-        y = list(map(int, y))
+        x = x.astype(int)
+        y = y.astype(int)
     return x, y
 
 
@@ -171,8 +174,7 @@ MediumOnGrid = Union[
 """A type for Medium objects that have at least one OnGrid component"""
 
 
-def unit_fibonacci_sphere(
-        samples: int = 128) -> List[Tuple[float, float, float]]:
+def unit_fibonacci_sphere(samples: int = 128) -> np.ndarray:
     """
     Generate evenly distributed points on the surface
     of a unit sphere using the Fibonacci Sphere method.
@@ -184,19 +186,16 @@ def unit_fibonacci_sphere(
             Default is 128.
 
     Returns:
-        points (list): A list of tuples representing the (x, y, z)
-            coordinates of the points on the sphere.
+        points (np.ndarray): A float32 array of shape `(samples, 3)` with
+            the (x, y, z) coordinates of the points on the sphere.
     """
-    points = []
     phi = math.pi * (3.0 - math.sqrt(5.0))  # golden angle in radians
-    for i in range(samples):
-        y = 1 - (i / float(samples - 1)) * 2  # y goes from 1 to -1
-        radius = math.sqrt(1 - y * y)  # radius at y
-        theta = phi * i  # golden angle increment
-        x = math.cos(theta) * radius
-        z = math.sin(theta) * radius
-        points.append((x, y, z))
-    return points
+    i = np.arange(samples, dtype=np.float32)
+    y = 1 - (i / float(samples - 1)) * 2  # y goes from 1 to -1
+    radius = np.sqrt(1 - y * y)  # radius at y
+    theta = phi * i  # golden angle increment
+    return np.stack([np.cos(theta) * radius, y,
+                     np.sin(theta) * radius], axis=1)
 
 
 def fibonacci_sphere(
@@ -220,7 +219,6 @@ def fibonacci_sphere(
     x, y, z (tuple): The x, y, and z coordinates of the points on the sphere.
     """
     points = unit_fibonacci_sphere(n)
-    points = np.array(points)
     points = points * radius + centre
     if cast_int:
         points = points.astype(int)
@@ -243,13 +241,13 @@ def circ_mask(N: Tuple[int, int], radius: float,
             the centre of the circle in the format (x, y).
 
     Returns:
-        mask (np.ndarray): The 2D mask as a numpy ndarray of integers.
-            The shape of the mask is N. Values inside the circle are 1, and values
-            outside the circle are 0.
+        mask (np.ndarray): The 2D mask as a boolean numpy ndarray.
+            The shape of the mask is N. Values inside the circle are True, and
+            values outside the circle are False.
     """
-    x, y = np.mgrid[0:N[0], 0:N[1]]
-    dist_from_centre = np.sqrt((x - centre[0]) ** 2 + (y - centre[1]) ** 2)
-    mask = (dist_from_centre < radius).astype(int)
+    x = np.arange(N[0])[:, None] - centre[0]
+    y = np.arange(N[1])[None, :] - centre[1]
+    mask = (x * x + y * y) < radius * radius
     return mask
 
 
@@ -270,14 +268,14 @@ def sphere_mask(
             centre of the sphere in the format (x, y, z).
 
     Returns:
-        mask (np.ndarray): The 3D mask as a numpy ndarray of integers. The shape of
-            the mask is N. Values inside the sphere are 1, and values outside the
-            sphere are 0.
+        mask (np.ndarray): The 3D mask as a boolean numpy ndarray. The shape of
+            the mask is N. Values inside the sphere are True, and values outside
+            the sphere are False.
     """
-    x, y, z = np.mgrid[0:N[0], 0:N[1], 0:N[2]]
-    dist_from_centre = np.sqrt((x - centre[0]) ** 2 + (y - centre[1]) ** 2 +
-                               (z - centre[2]) ** 2)
-    mask = (dist_from_centre < radius).astype(int)
+    x = np.arange(N[0])[:, None, None] - centre[0]
+    y = np.arange(N[1])[None, :, None] - centre[1]
+    z = np.arange(N[2])[None, None, :] - centre[2]
+    mask = (x * x + y * y + z * z) < radius * radius
     return mask
 
 
@@ -302,15 +300,21 @@ class Sources:
       ```
     """
     positions: Tuple[np.ndarray]
-    signals: Tuple[jnp.ndarray]
+    signals: jnp.ndarray
     dt: float
     domain: Domain
 
     def __init__(self, positions, signals, dt, domain):
         self.positions = positions
-        self.signals = signals
+        # Stage the signals on the device once, instead of rebuilding the
+        # array from a tuple or list at every time step.
+        self.signals = jnp.asarray(signals)
         self.dt = dt
         self.domain = domain
+        # Stage the scatter indices on the device once, instead of
+        # converting the position tuples at every call.
+        self._scatter_idx = tuple(
+            jnp.asarray(p, jnp.int32) for p in positions)
 
     def tree_flatten(self):
         children = (self.signals, self.dt)
@@ -319,9 +323,17 @@ class Sources:
 
     @classmethod
     def tree_unflatten(cls, aux, children):
+        # Rebuild without re-entering __init__: pytree leaves must be
+        # stored verbatim, not passed through jnp.asarray.
         signals, dt = children
         domain, positions = aux
-        a = cls(positions, signals, dt, domain)
+        a = object.__new__(cls)
+        a.positions = positions
+        a.signals = signals
+        a.dt = dt
+        a.domain = domain
+        a._scatter_idx = tuple(
+            jnp.asarray(p, jnp.int32) for p in positions)
         return a
 
     def to_binary_mask(self, N):
@@ -333,25 +345,27 @@ class Sources:
         Returns:
           jnp.ndarray: binary mask
         """
-        mask = jnp.zeros(N)
-        for i in range(len(self.positions[0])):
-            mask = mask.at[self.positions[0][i], self.positions[1][i]].set(1)
-        return mask > 0
+        idx = tuple(jnp.asarray(p, jnp.int32) for p in self.positions)
+        return jnp.zeros(N, dtype=bool).at[idx].set(True)
 
+    @jit
     def on_grid(self, n):
-
-        src = jnp.zeros(self.domain.N)
-        if len(self.signals) == 0:
-            return src
-
+        # The scatter over an empty set of positions is a no-op, so the
+        # "no sources" case needs no Python-level branch here.
         idx = n.astype(jnp.int32)
-        signals = self.signals[:, idx]
-        src = src.at[self.positions].add(signals)
-        return jnp.expand_dims(src, -1)
+        signals = lax.dynamic_index_in_dim(self.signals,
+                                           idx,
+                                           axis=1,
+                                           keepdims=False)
+        src = jnp.zeros(self.domain.N + (1,))
+        return src.at[self._scatter_idx + (0,)].add(signals)
 
     @staticmethod
     def no_sources(domain):
-        return Sources(positions=([], []), signals=([]), dt=1.0, domain=domain)
+        return Sources(positions=([], []),
+                       signals=jnp.zeros((0, 1)),
+                       dt=1.0,
+                       domain=domain)
 
 
 @register_pytree_node_class
@@ -412,11 +426,12 @@ def get_line_transducer(domain,
     if angle != 0:
         raise NotImplementedError("Angle not implemented yet")
 
-    # Generate mask
-    mask = jnp.zeros(domain.N)
+    # Generate mask from a single active row, so only a small 1D array
+    # is written before it is scattered into the full-size mask.
     start_col = (domain.N[1] - width) // 2
     end_col = (domain.N[1] + width) // 2
-    mask = mask.at[position, start_col:end_col].set(1.0)
+    row = jnp.zeros(domain.N[1]).at[start_col:end_col].set(1.0)
+    mask = jnp.zeros(domain.N).at[position].set(row)
     mask = jnp.expand_dims(mask, -1)
     mask = FourierSeries(mask, domain)
     return DistributedTransducer(mask, [], 0.0, domain)
@@ -465,20 +480,25 @@ class Sensors:
       ```
     """
 
-    positions: Tuple[tuple]
+    positions: Tuple[jnp.ndarray]
 
     def __init__(self, positions):
-        self.positions = positions
+        # Store the positions as int32 device arrays once, instead of
+        # converting the position tuples at every call.
+        self.positions = tuple(jnp.asarray(p, jnp.int32) for p in positions)
 
     def tree_flatten(self):
-        children = None
-        aux = (self.positions,)
+        children = (self.positions,)
+        aux = None
         return (children, aux)
 
     @classmethod
     def tree_unflatten(cls, aux, children):
-        positions = aux[0]
-        return cls(positions)
+        # Rebuild without re-entering __init__: pytree leaves must be
+        # stored verbatim, not passed through jnp.asarray.
+        a = object.__new__(cls)
+        a.positions = children[0]
+        return a
 
     def to_binary_mask(self, N):
         r"""
@@ -489,59 +509,119 @@ class Sensors:
         Returns:
           jnp.ndarray: binary mask
         """
-        mask = jnp.zeros(N)
-        for i in range(len(self.positions[0])):
-            mask = mask.at[self.positions[0][i], self.positions[1][i]].set(1)
-        return mask > 0
+        idx = tuple(jnp.asarray(p, jnp.int32) for p in self.positions)
+        return jnp.zeros(N, dtype=bool).at[idx].set(True)
 
     def __call__(self, p: Field, u: Field, rho: Field):
         r"""Returns the values of the field u at the sensors positions.
         Args:
           u (Field): The field to be sampled.
         """
-        if len(self.positions) == 1:
-            return p.on_grid[self.positions[0]]
-        elif len(self.positions) == 2:
-            return p.on_grid[self.positions[0],
-            self.positions[1]]  # type: ignore
-        elif len(self.positions) == 3:
-            return p.on_grid[self.positions[0], self.positions[1],
-            self.positions[2]]  # type: ignore
-        else:
+        if len(self.positions) not in (1, 2, 3):
             raise ValueError(
                 "Sensors positions must be 1, 2 or 3 dimensional. Not {}".
                 format(len(self.positions)))
+        return p.on_grid[self.positions]
+
 
+@lru_cache(maxsize=32)
+def _trig_pi_arange(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Cached sin and cos of `pi * arange(n)`, shared across sensor builds.
 
+    Computed with NumPy so the cached tables are concrete even when the
+    lookup happens inside a trace.
+    """
+    x = np.arange(n, dtype=np.float32) % 2
+    return np.sin(np.pi * x), np.cos(np.pi * x)
+
+
+@partial(jit, static_argnames=("n", "include_imag"))
 def _bli_function(x0: jnp.ndarray, x: jnp.ndarray, n: int, include_imag: bool = False) -> jnp.ndarray:
     """
     The function used to compute the band limited interpolation function.
 
     Args:
         x0 (jnp.ndarray): Position of the sensors along the axis.
-        x (jnp.ndarray): Grid positions.
+        x (jnp.ndarray): Grid positions. If None, the grid is taken as
+            `arange(n)` and cached trig tables are reused.
         n (int): Size of the grid
         include_imag (bool): Include the imaginary component?
 
     Returns:
     jnp.ndarray: The values of the function at the grid positions.
     """
-    dx = jnp.where((x - x0[:, None]) == 0, 1, x - x0[:, None])  # https://github.com/google/jax/issues/1052
-    dx_nonzero = (x - x0[:, None]) != 0
-
-    if n % 2 == 0:
-        y = jnp.sin(jnp.pi * dx) / \
-            jnp.tan(jnp.pi * dx / n) / n
-        y -= jnp.sin(jnp.pi * x0[:, None]) * jnp.sin(jnp.pi * x) / n
-        if include_imag:
-            y += 1j * jnp.cos(jnp.pi * x0[:, None]) * jnp.sin(jnp.pi * x) / n
+    # Evaluate sin and cos once on the small per-axis vectors and expand
+    # sin(pi*(x - x0)) with the angle-addition identity, so only the
+    # tan/sin of dx/n is evaluated per sensor and grid point. Arguments
+    # are reduced modulo the period before scaling by pi to keep the
+    # trig accurate for large grid coordinates.
+    if x is None:
+        x = jnp.arange(n, dtype=jnp.float32)
+        s_x, c_x = _trig_pi_arange(n)
     else:
-        y = jnp.sin(jnp.pi * dx) / \
-            jnp.sin(jnp.pi * dx / n) / n
+        x = jnp.ravel(x)
+        xr = x % 2
+        s_x = jnp.sin(jnp.pi * xr)
+        c_x = jnp.cos(jnp.pi * xr)
+
+    def per_sensor(x0_i):
+        dx_true = x - x0_i
+        dx = jnp.where(dx_true == 0, 1, dx_true)  # https://github.com/google/jax/issues/1052
+        dx_nonzero = dx_true != 0
+
+        x0r = x0_i % 2
+        s_x0 = jnp.sin(jnp.pi * x0r)
+        c_x0 = jnp.cos(jnp.pi * x0r)
+        sin_pi_dx = s_x * c_x0 - c_x * s_x0
+
+        if n % 2 == 0:
+            y = sin_pi_dx / jnp.tan(jnp.pi * dx / n) / n
+            y -= s_x0 * s_x / n
+            if include_imag:
+                y += 1j * c_x0 * s_x / n
+        else:
+            y = sin_pi_dx / jnp.sin(jnp.pi * dx / n) / n
+
+        # Deal with case of precisely on grid.
+        return jnp.where(jnp.all(dx_nonzero), y,
+                         (~dx_nonzero).astype(y.dtype))
+
+    # Map over the sensor axis, letting XLA tile the per-sensor rows
+    # instead of materializing every intermediate at full (sensors, grid)
+    # size.
+    y = vmap(per_sensor)(x0)
 
-    # Deal with case of precisely on grid.
-    y = y * jnp.all(dx_nonzero, axis=1)[:, None] + (1 - dx_nonzero) * (~jnp.all(dx_nonzero, axis=1)[:, None])
-    return y
+    # Keep the weights in single precision regardless of the x64 config:
+    # they multiply float32 pressure fields, and halving their footprint
+    # doubles the throughput of the sum-reductions in __call__.
+    return y.astype(jnp.complex64 if include_imag else jnp.float32)
+
+
+@lru_cache(maxsize=32)
+def _cached_bli_weights(pos_bytes: bytes, dtype: str, n: int) -> jnp.ndarray:
+    """Cached version of `_bli_function` keyed on the raw position bytes."""
+    positions = jnp.asarray(np.frombuffer(pos_bytes, dtype=dtype))
+    return _bli_function(positions, None, n)
+
+
+def _bli_weights(positions, n: int) -> jnp.ndarray:
+    """
+    Compute the band-limited interpolant weights along one axis,
+    reusing cached weights when the same positions are seen again.
+
+    Args:
+        positions: Position of the sensors along the axis.
+        n (int): Size of the grid.
+
+    Returns:
+        jnp.ndarray: The interpolation weights, of shape `(len(positions), n)`.
+    """
+    try:
+        pos = np.asarray(positions)
+    except TracerArrayConversionError:
+        # Traced positions cannot be hashed; compute the weights directly.
+        return _bli_function(positions, None, n)
+    return _cached_bli_weights(pos.tobytes(), pos.dtype.str, n)
 
 
 @register_pytree_node_class
@@ -560,25 +640,33 @@ class BLISensors:
     positions: Tuple[jnp.ndarray]
     n: Tuple[int]
 
+    def __new__(cls, positions: Tuple[jnp.ndarray], n: Tuple[int]):
+        # Dispatch to the dimension-specialized subclass, whose __call__
+        # is straight-line code with no Python-level branching.
+        if cls is BLISensors:
+            if len(n) not in _BLI_SENSORS_BY_DIM:
+                raise ValueError(
+                    "Sensors positions must be 1, 2 or 3 dimensional. Not {}".
+                    format(len(n)))
+            cls = _BLI_SENSORS_BY_DIM[len(n)]
+        return super().__new__(cls)
+
     def __init__(self, positions: Tuple[jnp.ndarray], n: Tuple[int]):
         self.positions = positions
         self.n = n
 
         # Calculate the band-limited interpolant weights if not provided.
-        x = jnp.arange(n[0])[None]
-        self.bx = jnp.expand_dims(_bli_function(positions[0], x, n[0]),
+        self.bx = jnp.expand_dims(_bli_weights(positions[0], n[0]),
                                   axis=range(2, 2 + len(n)))
 
         if len(n) > 1:
-            y = jnp.arange(n[1])[None]
-            self.by = jnp.expand_dims(_bli_function(positions[1], y, n[1]),
+            self.by = jnp.expand_dims(_bli_weights(positions[1], n[1]),
                                       axis=range(2, 2 + len(n) - 1))
         else:
             self.by = None
 
         if len(n) > 2:
-            z = jnp.arange(n[2])[None]
-            self.bz = jnp.expand_dims(_bli_function(positions[2], z, n[2]),
+            self.bz = jnp.expand_dims(_bli_weights(positions[2], n[2]),
                                       axis=range(2, 2 + len(n) - 2))
         else:
             self.bz = None
@@ -597,136 +685,49 @@ class BLISensors:
         Args:
           p (Field): The field to be sampled.
         """
-        if len(self.positions) == 1:
-            # 1D
-            pw = jnp.sum(p.on_grid[None] * self.bx, axis=1)
-            return pw
-        elif len(self.positions) == 2:
-            # 2D
-            pw = jnp.sum(p.on_grid[None] * self.bx, axis=1)
-            pw = jnp.sum(pw * self.by, axis=1)
-            return pw
-        elif len(self.positions) == 3:
-            # 3D
-            pw = jnp.sum(p.on_grid[None] * self.bx, axis=1)
-            pw = jnp.sum(pw * self.by, axis=1)
-            pw = jnp.sum(pw * self.bz, axis=1)
-            return pw
-        else:
-            raise ValueError(
-                "Sensors positions must be 1, 2 or 3 dimensional. Not {}".
-                format(len(self.positions)))
-
-
-def bli_function(x0: jnp.ndarray,
-                 x: jnp.ndarray,
-                 n: int,
-                 include_imag: bool = False) -> jnp.ndarray:
-    """
-    The function used to compute the band limited interpolation function.
-
-    Args:
-        x0 (jnp.ndarray): Position of the sensors along the axis.
-        x (jnp.ndarray): Grid positions.
-        n (int): Size of the grid
-        include_imag (bool): Include the imaginary component?
-
-    Returns:
-        jnp.ndarray: The values of the function at the grid positions.
-    """
-    dx = jnp.where(
-        (x - x0[:, None]) == 0, 1,
-        x - x0[:, None])    # https://github.com/google/jax/issues/1052
-    dx_nonzero = (x - x0[:, None]) != 0
-
-    if n % 2 == 0:
-        y = jnp.sin(jnp.pi * dx) / \
-            jnp.tan(jnp.pi * dx / n) / n
-        y -= jnp.sin(jnp.pi * x0[:, None]) * jnp.sin(jnp.pi * x) / n
-        if include_imag:
-            y += 1j * jnp.cos(jnp.pi * x0[:, None]) * jnp.sin(jnp.pi * x) / n
-    else:
-        y = jnp.sin(jnp.pi * dx) / \
-            jnp.sin(jnp.pi * dx / n) / n
-
-    # Deal with case of precisely on grid.
-    y = y * jnp.all(dx_nonzero, axis=1)[:, None] + (1 - dx_nonzero) * (
-        ~jnp.all(dx_nonzero, axis=1)[:, None])
-    return y
+        raise NotImplementedError
 
 
 @register_pytree_node_class
-class BLISensors:
-    """ Band-limited interpolant (off-grid) sensors.
-
-    Args:
-        positions (Tuple of List of float): Sensor positions.
-        n (Tuple of int): Grid size.
+class BLISensors1D(BLISensors):
+    """1D specialization of `BLISensors`."""
 
-    Attributes:
-        positions (Tuple[jnp.ndarray]): Sensor positions
-        n (Tuple[int]): Grid size.
-    """
-
-    positions: Tuple[jnp.ndarray]
-    n: Tuple[int]
-
-    def __init__(self, positions: Tuple[jnp.ndarray], n: Tuple[int]):
-        self.positions = positions
-        self.n = n
+    def __call__(self, p: Field, u, v):
+        r"""Returns the values of the field p at the sensors positions.
+        Args:
+          p (Field): The field to be sampled.
+        """
+        return jnp.sum(p.on_grid[None] * self.bx, axis=1)
 
-        # Calculate the band-limited interpolant weights if not provided.
-        x = jnp.arange(n[0])[None]
-        self.bx = jnp.expand_dims(bli_function(positions[0], x, n[0]),
-                                  axis=range(2, 2 + len(n)))
 
-        if len(n) > 1:
-            y = jnp.arange(n[1])[None]
-            self.by = jnp.expand_dims(bli_function(positions[1], y, n[1]),
-                                      axis=range(2, 2 + len(n) - 1))
-        else:
-            self.by = None
+@register_pytree_node_class
+class BLISensors2D(BLISensors):
+    """2D specialization of `BLISensors`."""
 
-        if len(n) > 2:
-            z = jnp.arange(n[2])[None]
-            self.bz = jnp.expand_dims(bli_function(positions[2], z, n[2]),
-                                      axis=range(2, 2 + len(n) - 2))
-        else:
-            self.bz = None
+    def __call__(self, p: Field, u, v):
+        r"""Returns the values of the field p at the sensors positions.
+        Args:
+          p (Field): The field to be sampled.
+        """
+        pw = jnp.sum(p.on_grid[None] * self.bx, axis=1)
+        return jnp.sum(pw * self.by, axis=1)
 
-    def tree_flatten(self):
-        children = self.positions,
-        aux = self.n,
-        return children, aux
 
-    @classmethod
-    def tree_unflatten(cls, aux, children):
-        return cls(*children, *aux)
+@register_pytree_node_class
+class BLISensors3D(BLISensors):
+    """3D specialization of `BLISensors`."""
 
     def __call__(self, p: Field, u, v):
         r"""Returns the values of the field p at the sensors positions.
         Args:
           p (Field): The field to be sampled.
         """
-        if len(self.positions) == 1:
-            # 1D
-            pw = jnp.sum(p.on_grid[None] * self.bx, axis=1)
-            return pw
-        elif len(self.positions) == 2:
-            # 2D
-            pw = jnp.sum(p.on_grid[None] * self.bx, axis=1)
-            pw = jnp.sum(pw * self.by, axis=1)
-            return pw
-        elif len(self.positions) == 3:
-            # 3D
-            pw = jnp.sum(p.on_grid[None] * self.bx, axis=1)
-            pw = jnp.sum(pw * self.by, axis=1)
-            pw = jnp.sum(pw * self.bz, axis=1)
-            return pw
-        else:
-            raise ValueError(
-                "Sensors positions must be 1, 2 or 3 dimensional. Not {}".
-                format(len(self.positions)))
+        pw = jnp.sum(p.on_grid[None] * self.bx, axis=1)
+        pw = jnp.sum(pw * self.by, axis=1)
+        return jnp.sum(pw * self.bz, axis=1)
+
+
+_BLI_SENSORS_BY_DIM = {1: BLISensors1D, 2: BLISensors2D, 3: BLISensors3D}
 
 
 @register_pytree_node_class
@@ -776,11 +777,20 @@ class TimeAxis:
               it is automatically calculated as the time required to travel
               from one corner of the domain to the opposite one.
         """
-        dt = cfl * min(medium.domain.dx) / functional(medium.sound_speed)(
-            np.max)
+        c = medium.sound_speed
+        if isinstance(c, Field):
+            c = c.on_grid
+        else:
+            c = jnp.asarray(c)
+        if c.ndim > 0:
+            c_min = float(jnp.min(c))
+            c_max = float(jnp.max(c))
+        else:
+            c_min = c_max = float(c)
+
+        dt = cfl * min(medium.domain.dx) / c_max
         if t_end is None:
             t_end = np.sqrt(
                 sum((x[-1] - x[0]) ** 2
-                    for x in medium.domain.spatial_axis)) / functional(
-                medium.sound_speed)(np.min)
+                    for x in medium.domain.spatial_axis)) / c_min
         return TimeAxis(dt=float(dt), t_end=float(t_end))
@@ -1,8 +1,8 @@
 import numpy as np
 from jax import numpy as jnp
 
-from jwave.geometry import (Domain, Medium, fibonacci_sphere, points_on_circle,
-                            unit_fibonacci_sphere)
+from jwave.geometry import (Domain, Medium, TimeAxis, fibonacci_sphere,
+                            points_on_circle, unit_fibonacci_sphere)
 
 
 def test_repr():
@@ -24,6 +24,20 @@ def test_repr():
     assert str(medium) == expected_output
 
 
+def test_time_axis_from_medium():
+    domain = Domain(N=(8, 9), dx=(1.0, 1.0))
+
+    # Scalar and ndarray sound speeds must give the same time axis
+    scalar_medium = Medium(domain=domain, sound_speed=1500.0)
+    array_medium = Medium(domain=domain, sound_speed=1500.0 * jnp.ones((8, 9)))
+
+    scalar_axis = TimeAxis.from_medium(scalar_medium)
+    array_axis = TimeAxis.from_medium(array_medium)
+
+    assert np.isclose(scalar_axis.dt, array_axis.dt)
+    assert np.isclose(scalar_axis.t_end, array_axis.t_end)
+
+
 def testpoints_on_circle():
     n = 5
     radius = 10.0
@@ -33,8 +47,8 @@ def testpoints_on_circle():
 
     x_actual, y_actual = points_on_circle(n, radius, centre, cast_int=True)
 
-    assert x_actual == x_expected
-    assert y_actual == y_expected
+    assert np.array_equal(x_actual, x_expected)
+    assert np.array_equal(y_actual, y_expected)
 
 
 def testunit_fibonacci_sphere():
@@ -1,25 +1,13 @@
-<<<<<<< HEAD
 import numpy as np
 import pytest
 
-from jwave.geometry import BLISensors, Domain, FourierSeries, bli_function
-
-
-@pytest.mark.parametrize("n_grid", [100, 101])
-def testbli_function(n_grid):
-    # Make a load of sensors on the grid. Check the bli function.
-    y = bli_function(np.arange(n_grid), np.arange(n_grid), n_grid)
-=======
 from jwave.geometry import _bli_function, BLISensors, Domain, FourierSeries
-import numpy as np
-import pytest
 
 
 @pytest.mark.parametrize("n_grid", [100, 101])
 def test_bli_function(n_grid):
     # Make a load of sensors on the grid. Check the bli function.
     y = _bli_function(np.arange(n_grid), np.arange(n_grid), n_grid)
->>>>>>> b4686d9c22839a9bb756fc553aa5c8801e59de43
     # Assert that the bli function is 1 at one place for each detector.
     assert (np.all(np.sum(y != 0, axis=1) == 1))
     # Assert that the bli function is 0 everywhere else
@@ -91,5 +79,5 @@ def test_sensor(nx, ny, nz):
 if __name__ == "__main__":
     test_bli_function(100)
     test_bli_function(101)
-    test_sensor()
+    test_sensor(100, 100, 100)
     test_sensor(100, 101, 102)